@@ -1,134 +1,336 @@
 import os
+import re
+import sys
+import hmac
+import atexit
 import json
-from datetime import datetime
+import hashlib
+import sqlite3
+from contextlib import contextmanager
+from datetime import date
 from colorama import Fore, Style, init
 from tabulate import tabulate
 
+try:
+    import readline
+except ImportError:  # Not available on Windows; prompts fall back to plain input()
+    readline = None
+
 # Initialize Colorama for color-coded output
 init(autoreset=True)
 
 TASKS_FILE = "tasks.json"
+TASKS_DB = "tasks.db"
 USERS_FILE = "users.json"
+HISTORY_FILE = ".taskflow_history"
+HISTORY_LENGTH = 500
+
+# Colorama's color codes, which readline has to be told take up no screen width
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+
+# Categories and priorities are stored as their index into these tuples,
+# so priority 0 (High) sorts first
+CATEGORIES = ("Work", "Personal", "University")
+PRIORITIES = ("High", "Medium", "Low")
+
+# Columns that edit_task may change; keyword names are checked against this before building SQL
+EDITABLE_FIELDS = ("description", "category", "priority", "deadline")
+
+def screen_block(*lines):
+    """Join lines into one block, resetting colors after each line like print() does with autoreset."""
+    return "".join(f"{line}{Style.RESET_ALL}\n" for line in lines)
+
+
+def numbered_menu(title, options):
+    """Build a menu listing the options numbered from 1."""
+    return "\n".join([f"\n{title}"] + [f"{number}. {option}" for number, option in enumerate(options, 1)])
+
+
+def write(block):
+    """Write a prebuilt block to the terminal in a single call."""
+    sys.stdout.write(block)
+    sys.stdout.flush()
+
+
+# Static screen chrome, built once at import instead of on every render
+PASTEL_HEADER = (
+    f"{Fore.MAGENTA}{Style.BRIGHT}" + "╔═" + "═" * 48 + "═╗" + "\n"
+    + f"{Fore.MAGENTA}{Style.BRIGHT}" + "║ " + "  No.  ║   ID   "
+    + "  ║  Description  ║  Category  ║ Priority ║ Deadline ║ Status ║" + "\n"
+    + f"{Fore.MAGENTA}{Style.BRIGHT}" + "╚═" + "═" * 48 + "═╝"
+)
+
+MENU = screen_block(
+    f"{Fore.MAGENTA}{' ' * 3}╔════════════════════ WELCOME TO TASKFLOW MANAGEMENT SYSTEM ════════════════════{' ' * 3}",
+    # Unique subheading with a different border and color
+    f"{Fore.CYAN}{' ' * 5}            ╔══════════ DEVELOPED BY TEAM ATNS ════════════════════════{' ' * 5}",
+    # Menu options in a structured and aligned way
+    f"{Fore.GREEN}\n╔═══════════════════════════════════════════════════════════════════════════╗",
+    f"{' ' * 10}1. Add Task",
+    f"{' ' * 10}2. View Tasks",
+    f"{' ' * 10}3. Edit Task",
+    f"{' ' * 10}4. Delete Task",
+    f"{' ' * 10}5. Mark Task as Complete",
+    f"{' ' * 10}6. Filter Tasks by Category",
+    f"{' ' * 10}7. Sort Tasks",
+    f"{' ' * 10}8. Exit",
+    "╚═══════════════════════════════════════════════════════════════════════════╝",
+)
+
+LOGIN_BANNER = screen_block(
+    f"{Fore.BLUE}\n{'=' * 50}",
+    f"{' ' * 12}Welcome to TaskFlow!{' ' * 12}",
+    f"{'=' * 50}\n",
+)
+LOGIN_SUCCESS = screen_block(
+    f"{Fore.GREEN}\n{'=' * 50}",
+    f"{' ' * 14}Login successful!{' ' * 14}",
+    f"{'=' * 50}",
+)
+LOGIN_FAILED = screen_block(
+    f"{Fore.RED}\n{'=' * 50}",
+    f"{' ' * 12}Invalid username or password.",
+    f"{'=' * 50}",
+)
+REGISTER_BANNER = screen_block(
+    f"{Fore.YELLOW}\n{'=' * 50}",
+    f"{' ' * 12}Welcome to the registration page!{' ' * 12}",
+    f"{'=' * 50}\n",
+)
+
+# Sort menu labels and the view_tasks sort_by value each one selects
+SORT_OPTIONS = ("Priority", "Deadline", "None")
+SORT_KEYS = ("priority", "deadline", None)
+
+CATEGORY_MENU = numbered_menu("Select Task Category:", CATEGORIES)
+PRIORITY_MENU = numbered_menu("Select Task Priority:", PRIORITIES)
+SORT_MENU = numbered_menu("Sort Tasks By:", SORT_OPTIONS)
+
+INVALID_CHOICE = (f"{Fore.RED}You have entered a wrong keyword or please enter a number within range\n "
+                  f"{Fore.MAGENTA}Thank you Professor Hamdi for making us aware of this error!{Style.RESET_ALL}")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    description TEXT,
+    category INTEGER,
+    priority INTEGER,
+    deadline TEXT,
+    completed INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_category ON tasks (category);
+CREATE INDEX IF NOT EXISTS idx_deadline ON tasks (deadline);
+-- Matches the priority sort's ORDER BY, so missing deadlines come last without a sort step
+CREATE INDEX IF NOT EXISTS idx_priority_deadline ON tasks (priority, deadline IS NULL, deadline);
+"""
 
 
 # --- Task Management Class ---
 class TaskManager:
     def __init__(self):
-        self.tasks = []
-        self.load_tasks()
-
-    def load_tasks(self):
-        """Load tasks from a JSON file."""
-        if os.path.exists(TASKS_FILE):
-            with open(TASKS_FILE, "r") as file:
-                self.tasks = json.load(file)
-        else:
-            self.tasks = []
-
-    def save_tasks(self):
-        """Save tasks to a JSON file."""
-        with open(TASKS_FILE, "w") as file:
-            json.dump(self.tasks, file, indent=4)
+        self._batch_depth = 0
+        # Rendered tables keyed by (filter_by, sort_by); cleared whenever tasks change
+        self._view_cache = {}
+        self.conn = sqlite3.connect(TASKS_DB)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        # user_version is set once the tasks.json import has been committed
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+            self.import_tasks()
+
+    def import_tasks(self):
+        """Import tasks from the old JSON file and mark the import as done.
+
+        Both happen in one transaction, so a failed import is retried on the next start.
+        """
+        with self.conn:
+            # A database that already holds tasks has nothing left to import
+            if self.conn.execute("SELECT 1 FROM tasks LIMIT 1").fetchone() is None and os.path.exists(TASKS_FILE):
+                with open(TASKS_FILE, "rb") as file:
+                    tasks = json.loads(file.read())
+                self.conn.executemany(
+                    "INSERT INTO tasks (id, description, category, priority, deadline, completed) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(task["id"], task["description"], CATEGORIES.index(task["category"]),
+                      PRIORITIES.index(task["priority"]),
+                      task["deadline"], task["completed"]) for task in tasks])
+            self.conn.execute("PRAGMA user_version = 1")
+
+    @contextmanager
+    def batch(self):
+        """Group several mutations into one transaction that is committed once.
+
+        Nested batches join the outermost one, which does the commit or rollback.
+        """
+        self._batch_depth += 1
+        try:
+            if self._batch_depth > 1:
+                yield
+            else:
+                with self.conn:
+                    yield
+        finally:
+            self._batch_depth -= 1
+            # A rolled-back batch may have left tables rendered from uncommitted rows
+            self._view_cache.clear()
+
+    def commit(self):
+        """Commit pending changes, or leave them to the enclosing batch."""
+        self._view_cache.clear()
+        if not self._batch_depth:
+            self.conn.commit()
 
     def add_task(self, description, category, priority, deadline=None):
-        """Add a new task."""
-        task = {
-            "id": len(self.tasks) + 1,
-            "description": description,
-            "category": category,
-            "priority": priority,
-            "deadline": deadline,
-            "completed": False,
-        }
-        self.tasks.append(task)
-        self.save_tasks()
+        """Add a new task. Category and priority are indexes into CATEGORIES and PRIORITIES."""
+        self.conn.execute(
+            "INSERT INTO tasks (description, category, priority, deadline, completed) VALUES (?, ?, ?, ?, 0)",
+            (description, category, priority, deadline))
+        self.commit()
         print(f"{Fore.GREEN}Task added successfully!{Style.RESET_ALL}")
 
     def view_tasks(self, filter_by=None, sort_by=None):
         """View tasks with optional filtering and sorting."""
-        tasks = self.tasks
+        key = (filter_by, sort_by)
+        if key not in self._view_cache:
+            self._view_cache[key] = self.render_tasks(filter_by, sort_by)
+        table_output = self._view_cache[key]
 
-        if filter_by:
-            tasks = [task for task in tasks if task["category"] == filter_by]
+        if table_output is None:
+            print(f"{Fore.YELLOW}No tasks found.{Style.RESET_ALL}")
+            return
+
+        print(PASTEL_HEADER)
+        print(f"{Fore.WHITE}{table_output}{Style.RESET_ALL}")
+
+    def render_tasks(self, filter_by=None, sort_by=None):
+        """Render the task table as a string, or None if no tasks match."""
+        query = "SELECT id, description, category, priority, deadline, completed FROM tasks"
+        params = ()
+
+        if filter_by is not None:
+            query += " WHERE category = ?"
+            params = (filter_by,)
 
         if sort_by == "priority":
-            # Sort by priority (High > Medium > Low)
-            priority_order = {"High": 0, "Medium": 1, "Low": 2}
-            tasks = sorted(tasks, key=lambda x: priority_order.get(x["priority"], 3))
+            # Priority is stored as its rank (High > Medium > Low), ties go to the earliest deadline
+            query += " ORDER BY priority, deadline IS NULL, deadline, id"
         elif sort_by == "deadline":
-            tasks = sorted(tasks, key=lambda x: x["deadline"] or "9999-12-31")
+            query += " ORDER BY deadline NULLS LAST, id"
+
+        tasks = self.conn.execute(query, params).fetchall()
 
         if not tasks:
-            print(f"{Fore.YELLOW}No tasks found.{Style.RESET_ALL}")
-            return
+            return None
 
         # Create the table with a pastel background for indexing title
-        headers = ["ID", "Description", "Category", "Priority", "Deadline", "Status"]
-        table = []
-
-        for task in tasks:
-            status = "✔" if task["completed"] else "✘"
-            table.append(
-                [task["id"], task["description"], task["category"], task["priority"], task["deadline"], status])
+        # "No." is only a display row number; "ID" is the stable key used for edits
+        headers = ["No.", "ID", "Description", "Category", "Priority", "Deadline", "Status"]
+        # Rows are generated straight into tabulate instead of building an intermediate list
+        table = ((number, task["id"], task["description"], CATEGORIES[task["category"]], PRIORITIES[task["priority"]],
+                  task["deadline"], "✔" if task["completed"] else "✘")
+                 for number, task in enumerate(tasks, 1))
 
         # Table formatting with pastel header and white background for content
-        table_output = tabulate(table, headers=headers, tablefmt="fancy_grid", stralign="center")
-
-        # Adding pastel background to header manually (you can adjust colors)
-        pastel_header = f"{Fore.MAGENTA}{Style.BRIGHT}" + "╔═" + "═" * 48 + "═╗" + "\n"
-        pastel_header += f"{Fore.MAGENTA}{Style.BRIGHT}" + "║ " + "   ID   " + "  ║  Description  ║  Category  ║ Priority ║ Deadline ║ Status ║" + "\n"
-        pastel_header += f"{Fore.MAGENTA}{Style.BRIGHT}" + "╚═" + "═" * 48 + "═╝"
-
-        print(f"{pastel_header}")
-        print(f"{Fore.WHITE}{table_output}{Style.RESET_ALL}")
+        return tabulate(table, headers=headers, tablefmt="fancy_grid", stralign="center")
 
     def edit_task(self, task_id, **kwargs):
-        """Edit an existing task."""
-        for task in self.tasks:
-            if task["id"] == task_id:
-                task.update({k: v for k, v in kwargs.items() if v is not None})
-                self.save_tasks()
-                print(f"{Fore.GREEN}Task updated successfully!{Style.RESET_ALL}")
-                return
-        print(f"{Fore.RED}Task ID not found.{Style.RESET_ALL}")
-
-    def delete_task(self, task_id):
-        """Delete a task and adjust the IDs of subsequent tasks."""
-        # Remove the task with the specified task_id
-        self.tasks = [task for task in self.tasks if task["id"] != task_id]
+        """Edit an existing task. Fields passed as None are left unchanged."""
+        unknown = set(kwargs) - set(EDITABLE_FIELDS)
+        if unknown:
+            raise TypeError(f"edit_task() got unexpected fields: {', '.join(sorted(unknown))}")
+
+        fields = {k: v for k, v in kwargs.items() if v is not None}
+        if fields:
+            assignments = ", ".join(f"{field} = ?" for field in fields)
+            cursor = self.conn.execute(f"UPDATE tasks SET {assignments} WHERE id = ?", (*fields.values(), task_id))
+            self.commit()
+            found = cursor.rowcount
+        else:
+            found = self.conn.execute("SELECT 1 FROM tasks WHERE id = ?", (task_id,)).fetchone()
 
-        # Adjust task IDs for remaining tasks
-        for i, task in enumerate(self.tasks):
-            task["id"] = i + 1  # Reassign IDs to ensure they are contiguous
+        if found:
+            print(f"{Fore.GREEN}Task updated successfully!{Style.RESET_ALL}")
+        else:
+            print(f"{Fore.RED}Task ID not found.{Style.RESET_ALL}")
 
-        # Save the updated list of tasks
-        self.save_tasks()
-        print(f"{Fore.GREEN}Task deleted successfully! IDs have been updated.{Style.RESET_ALL}")
+    def delete_task(self, task_id):
+        """Delete a task. IDs of the remaining tasks are left unchanged."""
+        cursor = self.conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        self.commit()
+        if cursor.rowcount:
+            print(f"{Fore.GREEN}Task deleted successfully!{Style.RESET_ALL}")
+        else:
+            print(f"{Fore.RED}Task ID not found.{Style.RESET_ALL}")
 
     def mark_task_complete(self, task_id):
         """Mark a task as completed."""
-        for task in self.tasks:
-            if task["id"] == task_id:
-                task["completed"] = True
-                self.save_tasks()
-                print(f"{Fore.GREEN}Task marked as completed!{Style.RESET_ALL}")
-                return
-        print(f"{Fore.RED}Task ID not found.{Style.RESET_ALL}")
+        cursor = self.conn.execute("UPDATE tasks SET completed = 1 WHERE id = ?", (task_id,))
+        self.commit()
+        if cursor.rowcount:
+            print(f"{Fore.GREEN}Task marked as completed!{Style.RESET_ALL}")
+        else:
+            print(f"{Fore.RED}Task ID not found.{Style.RESET_ALL}")
 
 
 # --- User Authentication Functions ---
+# Parsed users.json, reused for as long as the file's mtime is unchanged
+_users_cache = None
+_users_mtime = None
+
+
 def load_users():
-    """Load users from the JSON file."""
-    if os.path.exists(USERS_FILE):
-        with open(USERS_FILE, "r") as file:
-            return json.load(file)
-    return []
+    """Load users from the JSON file as a {username: record} dict."""
+    global _users_cache, _users_mtime
+    if not os.path.exists(USERS_FILE):
+        return {}
+    mtime = os.path.getmtime(USERS_FILE)
+    if _users_cache is None or mtime != _users_mtime:
+        # json.loads decodes the raw bytes itself (JSON is UTF-8), skipping the text-mode reader
+        with open(USERS_FILE, "rb") as file:
+            _users_cache = {user.pop("username"): user for user in json.loads(file.read())}
+        _users_mtime = mtime
+    return _users_cache
 
 
 def save_users(users):
-    """Save users to the JSON file."""
-    with open(USERS_FILE, "w") as file:
-        json.dump(users, file, indent=4)
+    """Save the {username: record} dict to the JSON file."""
+    global _users_cache
+    # Write to a temporary file and swap it in so a crash never leaves a half-written file
+    temp_file = USERS_FILE + ".tmp"
+    with open(temp_file, "w") as file:
+        json.dump([{"username": username, **record} for username, record in users.items()], file, indent=4)
+    os.replace(temp_file, USERS_FILE)
+    _users_cache = None
+
+
+# Salt for the throwaway derivation done when there is no stored hash to check
+DUMMY_SALT = bytes(16)
+
+
+def derive_key(password, salt):
+    """Derive the scrypt hash of a password."""
+    return hashlib.scrypt(password.encode(), salt=salt, n=16384, r=8, p=1)
+
+
+def hash_password(password):
+    """Create a salted password record for a new password."""
+    salt = os.urandom(16)
+    return {"salt": salt.hex(), "hash": derive_key(password, salt).hex()}
+
+
+def check_password(record, password):
+    """Check a password against a user record (None for an unknown user) in constant time."""
+    if record is None or "hash" not in record:
+        # Do the same scrypt work anyway so timing does not reveal which usernames exist
+        derive_key(password, DUMMY_SALT)
+        if record is None:
+            return False
+        # Old records still hold the plaintext password
+        return hmac.compare_digest(record["password"].encode(), password.encode())
+    password_hash = derive_key(password, bytes.fromhex(record["salt"]))
+    return hmac.compare_digest(password_hash, bytes.fromhex(record["hash"]))
 
 
 def authenticate_user():
@@ -136,24 +338,21 @@ def authenticate_user():
     users = load_users()
 
     # Improved login screen formatting
-    print(f"{Fore.BLUE}\n{'=' * 50}")
-    print(f"{' ' * 12}Welcome to TaskFlow!{' ' * 12}")
-    print(f"{'=' * 50}{Style.RESET_ALL}\n")
+    write(LOGIN_BANNER)
 
     username = input("Enter your Username/ID: ").strip()
     password = input("Enter your Password: ").strip()
 
     # Check if user exists and password matches
-    for user in users:
-        if user["username"] == username and user["password"] == password:
-            print(f"{Fore.GREEN}\n{'=' * 50}")
-            print(f"{' ' * 14}Login successful!{' ' * 14}")
-            print(f"{'=' * 50}{Style.RESET_ALL}")
-            return username
-
-    print(f"{Fore.RED}\n{'=' * 50}")
-    print(f"{' ' * 12}Invalid username or password.{Style.RESET_ALL}")
-    print(f"{'=' * 50}")
+    record = users.get(username)
+    if check_password(record, password):
+        if "hash" not in record:
+            # Replace the plaintext password now that we know it is correct
+            save_users({**users, username: hash_password(password)})
+        write(LOGIN_SUCCESS)
+        return username
+
+    write(LOGIN_FAILED)
     return None
 
 
@@ -161,22 +360,18 @@ def register_user():
     """Register a new user."""
     users = load_users()
 
-    print(f"{Fore.YELLOW}\n{'=' * 50}")
-    print(f"{' ' * 12}Welcome to the registration page!{' ' * 12}")
-    print(f"{'=' * 50}{Style.RESET_ALL}\n")
+    write(REGISTER_BANNER)
 
     username = input("Enter a new Username/ID: ").strip()
     password = input("Enter a new Password: ").strip()
 
     # Check if the username already exists
-    for user in users:
-        if user["username"] == username:
-            print(f"{Fore.RED}Username already exists. Please try again.{Style.RESET_ALL}")
-            return None
+    if username in users:
+        print(f"{Fore.RED}Username already exists. Please try again.{Style.RESET_ALL}")
+        return None
 
-    # Add the new user to the users list
-    users.append({"username": username, "password": password})
-    save_users(users)
+    # Add the new user to the users
+    save_users({**users, username: hash_password(password)})
     print(f"{Fore.GREEN}\nHurray!! Your Registration has been completed!")
     print(f"{Fore.GREEN}Please log in to continue.{Style.RESET_ALL}")
 
@@ -185,69 +380,74 @@ def register_user():
 
 
 # --- User Interface ---
+def setup_history():
+    """Load prompt history and save it again on exit (needs readline)."""
+    if readline is None:
+        return
+    # Drop anything typed at the login prompts so passwords never reach the history file
+    readline.clear_history()
+    if os.path.exists(HISTORY_FILE):
+        readline.read_history_file(HISTORY_FILE)
+    readline.set_history_length(HISTORY_LENGTH)
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+    atexit.register(readline.write_history_file, HISTORY_FILE)
+
+
+def color_prompt(text):
+    """Wrap a colored prompt's escapes in \\001/\\002 so readline measures its width correctly."""
+    # input() only hands the prompt to readline when both ends are a terminal
+    if readline is None or not (sys.stdin.isatty() and sys.stdout.isatty()):
+        return text
+    return ANSI_ESCAPE.sub("\001\\g<0>\002", text)
+
+
+def prompt(text, options=()):
+    """Read a line of input, tab-completing from options when readline is available."""
+    if readline is None:
+        return input(text).strip()
+
+    def complete(prefix, state):
+        matches = [option for option in options if option.lower().startswith(prefix.lower())]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(complete)
+    try:
+        return input(text).strip()
+    finally:
+        readline.set_completer(None)
+
+
 def display_menu():
-    print(
-        f"{Fore.MAGENTA}{' ' * 3}╔════════════════════ WELCOME TO TASKFLOW MANAGEMENT SYSTEM ════════════════════{' ' * 3}{Style.RESET_ALL}")
+    write(MENU)
 
-    # Unique subheading with a different border and color
-    print(
-        f"{Fore.CYAN}{' ' * 5}            ╔══════════ DEVELOPED BY TEAM ATNS ════════════════════════{' ' * 5}{Style.RESET_ALL}")
 
-    # Menu options in a structured and aligned way
-    print(f"{Fore.GREEN}\n╔═══════════════════════════════════════════════════════════════════════════╗")
-    print(f"{' ' * 10}1. Add Task")
-    print(f"{' ' * 10}2. View Tasks")
-    print(f"{' ' * 10}3. Edit Task")
-    print(f"{' ' * 10}4. Delete Task")
-    print(f"{' ' * 10}5. Mark Task as Complete")
-    print(f"{' ' * 10}6. Filter Tasks by Category")
-    print(f"{' ' * 10}7. Sort Tasks")
-    print(f"{' ' * 10}8. Exit")
-    print(f"╚═══════════════════════════════════════════════════════════════════════════╝{Style.RESET_ALL}")
+def menu_select(menu, options):
+    """Show a prebuilt menu until a valid choice is made and return the option's index.
+
+    The choice can be typed as its number or as the option name (tab-completed).
+    """
+    names = {option.lower(): index for index, option in enumerate(options)}
+    while True:
+        print(menu)
+        choice = prompt(f"Enter your choice (1-{len(options)}): ", options)
+        if choice.isdecimal() and 1 <= int(choice) <= len(options):
+            return int(choice) - 1
+        if choice.lower() in names:
+            return names[choice.lower()]
+        print(INVALID_CHOICE)
 
 
 def input_category():
-    """Prompt the user to select a category with validation."""
-    while True:
-        print("\nSelect Task Category:")
-        print("1. Work")
-        print("2. Personal")
-        print("3. University")
-        choice = input("Enter your choice (1-3): ").strip()
-        if choice == "1":
-            return "Work"
-        elif choice == "2":
-            return "Personal"
-        elif choice == "3":
-            return "University"
-        elif choice.isdigit():
-            print(
-                f"{Fore.RED}You have entered a wrong keyword or please enter a number! within range\n {Fore.MAGENTA}Thank you Professor Hamdi for making us aware of this error!{Style.RESET_ALL}")
-        else:
-            print(
-                f"{Fore.RED}You have entered a wrong keyword or please enter a number! within range\n {Fore.MAGENTA}Thank you Professor Hamdi for making us aware of this error!{Style.RESET_ALL}")
+    """Prompt the user to select a category and return its index in CATEGORIES."""
+    return menu_select(CATEGORY_MENU, CATEGORIES)
 
 
 def input_priority():
-    """Prompt the user to select priority with validation."""
-    while True:
-        print("\nSelect Task Priority:")
-        print("1. High")
-        print("2. Medium")
-        print("3. Low")
-        choice = input("Enter your choice (1-3): ").strip()
-        if choice == "1":
-            return "High"
-        elif choice == "2":
-            return "Medium"
-        elif choice == "3":
-            return "Low"
-        elif choice.isdigit():
-            print(
-                f"{Fore.RED}You have entered a wrong keyword or please enter a number within range\n {Fore.MAGENTA}Thank you Professor Hamdi for making us aware of this error!{Style.RESET_ALL}")
-        else:
-            print(
-                f"{Fore.RED}You have entered a wrong keyword or please enter a number within range\n {Fore.MAGENTA}Thank you Professor Hamdi for making us aware of this error!{Style.RESET_ALL}")
+    """Prompt the user to select a priority and return its index in PRIORITIES."""
+    return menu_select(PRIORITY_MENU, PRIORITIES)
 
 
 def input_date():
@@ -258,50 +458,34 @@ def input_date():
             return None
         try:
             # Check if the input matches the required date format
-            entered_date = datetime.strptime(deadline, "%Y-%m-%d")
+            entered_date = date.fromisoformat(deadline)
 
             # Check if the entered date is in the past
-            if entered_date < datetime.now():
+            if entered_date < date.today():
                 print(f"{Fore.RED}The date you have entered has already passed, please enter a future date.{Style.RESET_ALL}")
                 continue
 
-            return deadline
+            # Store the canonical YYYY-MM-DD form so deadlines sort as text
+            return entered_date.isoformat()
         except ValueError:
             print(f"{Fore.RED}Please enter a date in the format YYYY-MM-DD, or hit Enter to continue.{Style.RESET_ALL}")
 
 
 def input_sort_option():
-    """Prompt the user to choose sorting option with validation."""
-    while True:
-        print("\nSort Tasks By:")
-        print("1. Priority")
-        print("2. Deadline")
-        print("3. None")
-        choice = input("Enter your choice (1-3): ").strip()
-        if choice == "1":
-            return "priority"
-        elif choice == "2":
-            return "deadline"
-        elif choice == "3":
-            return None
-        elif choice.isdigit():
-            print(
-                f"{Fore.RED}You have entered a wrong keyword or please enter a number within range\n {Fore.MAGENTA}Thank you Professor Hamdi for making us aware of this error!{Style.RESET_ALL}")
-        else:
-            print(
-                f"{Fore.RED}You have entered a wrong keyword or please enter a number within range\n {Fore.MAGENTA}Thank you Professor Hamdi for making us aware of this error!{Style.RESET_ALL}")
+    """Prompt the user to choose a sorting option and return the matching sort_by value."""
+    return SORT_KEYS[menu_select(SORT_MENU, SORT_OPTIONS)]
 
 
 def return_to_home():
     """Display a 'Return to Home' option to go back to the main menu."""
-    input(f"{Fore.CYAN}\n--- Press Enter to return to Home Menu ---{Style.RESET_ALL}")
+    input(color_prompt(f"{Fore.CYAN}\n--- Press Enter to return to Home Menu ---{Style.RESET_ALL}"))
 
 
 def main():
     print(f"{Fore.CYAN}\nWelcome to TaskFlow! Please select an option:")
     print(f"{Fore.GREEN}1. Log in")
     print(f"{Fore.YELLOW}2. Register new user")
-    choice = input(f"{Fore.CYAN}Enter your choice (1-2): ").strip()
+    choice = input(color_prompt(f"{Fore.CYAN}Enter your choice (1-2): {Style.RESET_ALL}")).strip()
 
     if choice == "1":
         username = authenticate_user()
@@ -317,6 +501,7 @@ def main():
         print(f"{Fore.RED}Invalid choice! Exiting TaskFlow for security reason.{Style.RESET_ALL}")
         return
 
+    setup_history()
     task_manager = TaskManager()
 
     while True:
@@ -324,7 +509,7 @@ def main():
         choice = input("Enter your choice (1-8): ").strip()
 
         if choice == "1":
-            description = input("Task Description: ").strip()
+            description = prompt("Task Description: ")
             category = input_category()
             priority = input_priority()
             deadline = input_date()
@@ -342,18 +527,18 @@ def main():
             task_id = input("Enter Task ID to edit: ").strip()
 
             if not task_id.isdigit():
-                print(
-                    f"{Fore.RED}You have entered a wrong keyword or please enter a number within range\n {Fore.MAGENTA}Thank you Professor Hamdi for making us aware of this error!{Style.RESET_ALL}")
+                print(INVALID_CHOICE)
                 return
 
             task_id = int(task_id)
-            description = input("New Task Description (leave empty to keep current): ").strip()
+            description = prompt("New Task Description (leave empty to keep current): ")
             category = input_category()
             priority = input_priority()
             deadline = input_date()
 
-            task_manager.edit_task(task_id, description=description, category=category, priority=priority,
-                                   deadline=deadline)
+            with task_manager.batch():
+                task_manager.edit_task(task_id, description=description, category=category, priority=priority,
+                                       deadline=deadline)
 
             return_to_home()
 
@@ -363,8 +548,7 @@ def main():
             task_id = input("Enter Task ID to delete: ").strip()
 
             if not task_id.isdigit():
-                print(
-                    f"{Fore.RED}You have entered a wrong keyword or please enter a number within range\n {Fore.MAGENTA}Thank you Professor Hamdi for making us aware of this error!{Style.RESET_ALL}")
+                print(INVALID_CHOICE)
                 return
 
             task_id = int(task_id)
@@ -378,8 +562,7 @@ def main():
             task_id = input("Enter Task ID to mark as completed: ").strip()
 
             if not task_id.isdigit():
-                print(
-                    f"{Fore.RED}You have entered a wrong keyword or please enter a number within range\n {Fore.MAGENTA}Thank you Professor Hamdi for making us aware of this error!{Style.RESET_ALL}")
+                print(INVALID_CHOICE)
                 return
 
             task_id = int(task_id)